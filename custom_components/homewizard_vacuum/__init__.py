@@ -32,9 +32,16 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     await hass.config_entries.async_forward_entry_setups(config_entry, ["sensor"])
     await hass.config_entries.async_forward_entry_setups(config_entry, ["switch"])
 
+    # Reload the entry when the options change
+    config_entry.async_on_unload(config_entry.add_update_listener(async_reload_entry))
+
     # Return true to denote a successful setup.
     return True
 
+async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Reload config entry after the options changed."""
+    await hass.config_entries.async_reload(config_entry.entry_id)
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, config_entry: ConfigEntry, device_entry: DeviceEntry
 ) -> bool:
@@ -46,6 +53,10 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     """Unload a config entry."""
     # This is called when you remove your integration or shutdown HA.
 
+    # Stop a running cleaning sequence
+    coordinator: HWCleanerCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    await coordinator.cancel_sequence()
+
     # Unload services
     for service in hass.services.async_services_for_domain(DOMAIN):
         hass.services.async_remove(DOMAIN, service)
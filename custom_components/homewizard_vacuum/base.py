@@ -1,8 +1,10 @@
 import logging
+import time
 
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 
 from .const import DOMAIN
 from .coordinator import HWCleanerCoordinator
@@ -58,4 +60,87 @@ class HWCleanerBaseEntity(CoordinatorEntity):
     @property
     def unique_id(self) -> str:
         """Return unique id."""
-        return f"{DOMAIN}-{self.coordinator._device_identifier}-{self._name}"
\ No newline at end of file
+        return f"{DOMAIN}-{self.coordinator._device_identifier}-{self._name}"
+
+
+class HWCleanerBatteryPublishMixin:
+    """Battery Publish Mixin Class.
+
+    Publishes the battery percentage following the publish policy from the
+    options flow. The coordinator keeps the actual value, the entity only moves
+    its published value when the change reaches the deadband and the minimum
+    publish interval has passed, or when the device status changed.
+    """
+
+    coordinator: HWCleanerCoordinator
+
+    def __init__(
+        self, coordinator: HWCleanerCoordinator, name: str
+    ) -> None:
+        """Initialise entity."""
+        super().__init__(coordinator, name)
+        self._published_battery = coordinator._attr_battery_percentage
+        self._published_status = coordinator._attr_device_status
+        self._published_at = time.monotonic()
+        self._unsub_trailing_publish = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending publish when the entity is removed."""
+        self._cancel_trailing_publish()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update entity with latest data from coordinator."""
+        self._update_published_battery()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _update_published_battery(self) -> None:
+        """Apply the publish policy to the latest battery percentage."""
+        battery = self.coordinator._attr_battery_percentage
+        status = self.coordinator._attr_device_status
+        status_changed = status != self._published_status
+        self._published_status = status
+
+        if battery == self._published_battery:
+            self._cancel_trailing_publish()
+            return
+
+        now = time.monotonic()
+        forced = (
+            battery is None
+            or self._published_battery is None
+            or (status_changed and self.coordinator._publish_on_status_change)
+        )
+        if not forced:
+            if abs(battery - self._published_battery) < self.coordinator._battery_deadband:
+                self._cancel_trailing_publish()
+                return
+
+            # Publish the value once the interval has passed, even without a new poll
+            remaining = self.coordinator._min_publish_interval - (now - self._published_at)
+            if remaining > 0:
+                if self._unsub_trailing_publish is None:
+                    self._unsub_trailing_publish = async_call_later(
+                        self.hass, remaining, self._async_trailing_publish
+                    )
+                return
+
+        self._cancel_trailing_publish()
+        self._published_battery = battery
+        self._published_at = now
+
+    @callback
+    def _async_trailing_publish(self, _now) -> None:
+        """Publish a battery percentage held back by the minimum interval."""
+        self._unsub_trailing_publish = None
+        self._update_published_battery()
+        self.async_write_ha_state()
+
+    @callback
+    def _cancel_trailing_publish(self) -> None:
+        """Cancel a pending publish."""
+        if self._unsub_trailing_publish is not None:
+            self._unsub_trailing_publish()
+            self._unsub_trailing_publish = None
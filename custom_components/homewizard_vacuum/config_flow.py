@@ -8,7 +8,18 @@ from homeassistant.core import callback
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, CONF_NAME
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 
-from .const import API_URL, CONF_ENDPOINT, CONF_IDENTIFIER, DOMAIN
+from .const import (
+    API_URL,
+    CONF_ENDPOINT,
+    CONF_IDENTIFIER,
+    DOMAIN,
+    CONF_BATTERY_DEADBAND,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_PUBLISH_ON_STATUS_CHANGE,
+    DEFAULT_BATTERY_DEADBAND,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_PUBLISH_ON_STATUS_CHANGE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -107,4 +118,20 @@ class RobotVacuumOptionsFlow(OptionsFlow):
 
     def _get_options_schema(self):
         """Return the options schema for the form."""
-        return vol.Schema({})
+        options = self.config_entry.options
+        return vol.Schema({
+            vol.Required(
+                CONF_BATTERY_DEADBAND,
+                default=options.get(CONF_BATTERY_DEADBAND, DEFAULT_BATTERY_DEADBAND),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+            vol.Required(
+                CONF_MIN_PUBLISH_INTERVAL,
+                default=options.get(CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Required(
+                CONF_PUBLISH_ON_STATUS_CHANGE,
+                default=options.get(
+                    CONF_PUBLISH_ON_STATUS_CHANGE, DEFAULT_PUBLISH_ON_STATUS_CHANGE
+                ),
+            ): bool,
+        })
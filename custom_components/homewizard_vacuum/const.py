@@ -1,6 +1,45 @@
+from homeassistant.components.vacuum import VacuumActivity
+
 DOMAIN = "homewizard_vacuum"
 CONF_ENDPOINT = "endpoint"
 CONF_IDENTIFIER = "identifier"
 API_URL = "https://api.homewizardeasyonline.com/v1"
 DEFAULT_SCAN_INTERVAL = 60
-MIN_SCAN_INTERVAL = 10
\ No newline at end of file
+MIN_SCAN_INTERVAL = 10
+DEFAULT_SEQUENCE_STEP_TIMEOUT = 4 * 60 * 60
+
+# Publish policy for the battery level, the defaults publish every change
+CONF_BATTERY_DEADBAND = "battery_deadband"
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+CONF_PUBLISH_ON_STATUS_CHANGE = "publish_on_status_change"
+DEFAULT_BATTERY_DEADBAND = 1
+DEFAULT_MIN_PUBLISH_INTERVAL = 0
+DEFAULT_PUBLISH_ON_STATUS_CHANGE = True
+
+# Decoded values for the API enums, precomputed so a poll only does lookups
+API_STATUS_LABELS = {
+    "working": "Working",
+    "charging": "Charging",
+    "finished_charging": "Finished Charging",
+    "standby": "Standby",
+    "stopped": "Stopped",
+    "docking": "Docking",
+    "malfunction": "Malfunction",
+}
+API_STATUS_TO_HA = {
+    "working": VacuumActivity.CLEANING,
+    "charging": VacuumActivity.DOCKED,
+    "finished_charging": VacuumActivity.DOCKED,
+    "standby": VacuumActivity.IDLE,
+    "stopped": VacuumActivity.IDLE,
+    "docking": VacuumActivity.RETURNING,
+    "malfunction": VacuumActivity.ERROR,
+}
+
+FAN_SPEEDS = ["Quiet", "Normal", "Strong"]
+API_FAN_SPEEDS = {
+    "Quiet": "stop",
+    "Normal": "normal",
+    "Strong": "strong",
+}
+REVERSE_API_FAN_SPEEDS = {v: k for k, v in API_FAN_SPEEDS.items()}
@@ -1,18 +1,70 @@
 import aiohttp
+import asyncio
 import logging
+import sys
 
 from datetime import timedelta
 
-from .const import DOMAIN, API_URL, CONF_IDENTIFIER, CONF_ENDPOINT, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    API_URL,
+    CONF_IDENTIFIER,
+    CONF_ENDPOINT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SEQUENCE_STEP_TIMEOUT,
+    CONF_BATTERY_DEADBAND,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_PUBLISH_ON_STATUS_CHANGE,
+    DEFAULT_BATTERY_DEADBAND,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_PUBLISH_ON_STATUS_CHANGE,
+    API_STATUS_LABELS,
+    API_STATUS_TO_HA,
+    REVERSE_API_FAN_SPEEDS,
+)
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, CONF_NAME
+from homeassistant.components.vacuum import VacuumActivity
+from homeassistant.util.json import json_loads
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# Labels for enum values missing from the precomputed tables, filled on first sight
+_STATUS_LABELS: dict[str, str] = dict(API_STATUS_LABELS)
+_BRUSH_LABELS: dict[str, str] = {}
+_SOUND_LABELS: dict[str, str] = {}
+_FAULT_LABELS: dict[str, str] = {}
+
+# Upper bound per table, the values come straight from the device response
+_MAX_CACHED_LABELS = 64
+
+
+def _decode_label(labels: dict[str, str], value, replace_underscores=False) -> str | None:
+    """Return the display label for an API enum value.
+
+    Only string values are cached, anything else gets an uncached label.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            return labels[value]
+        except KeyError:
+            pass
+
+    label = str(value)
+    if replace_underscores:
+        label = label.replace("_", " ")
+    label = label.title()
+
+    if isinstance(value, str) and len(labels) < _MAX_CACHED_LABELS:
+        label = labels[value] = sys.intern(label)
+    return label
+
 class HWCleanerCoordinator(DataUpdateCoordinator):
     """Representation of a Homewizard Vacuum Cleaner."""
 
@@ -26,17 +78,32 @@ class HWCleanerCoordinator(DataUpdateCoordinator):
         self._device_endpoint = config_entry.data[CONF_ENDPOINT]
         self._name = config_entry.data[CONF_NAME]
 
+        # Set publish policy from values entered in options flow
+        self._battery_deadband = config_entry.options.get(
+            CONF_BATTERY_DEADBAND, DEFAULT_BATTERY_DEADBAND
+        )
+        self._min_publish_interval = config_entry.options.get(
+            CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+        )
+        self._publish_on_status_change = config_entry.options.get(
+            CONF_PUBLISH_ON_STATUS_CHANGE, DEFAULT_PUBLISH_ON_STATUS_CHANGE
+        )
+
         self._api_url = API_URL
         self._token = None
         self._poll_interval = 30
 
         self._attr_device_status = None
+        self._attr_activity = None
         self._attr_fw_version = None
         self._attr_brush_type = None
         self._attr_faults = None
         self._attr_sound_status = None
         self._attr_battery_percentage = None
         self._attr_fan_mode = None
+        self._attr_fan_speed = None
+
+        self._sequence_task = None
 
         # Initialise DataUpdateCoordinator
         super().__init__(
@@ -86,27 +153,126 @@ class HWCleanerCoordinator(DataUpdateCoordinator):
         """Fetch the latest state from the API."""
         _LOGGER.debug("Update status")
         data = await self._send_api_command(None, None)
+        self._decode_status(data)
 
-        # Parse response into attributes
-        self._attr_device_status = data.get("status").replace("_", " ").title()
-        self._attr_brush_type = data.get("brush").title()
-        self._attr_sound_status = data.get("sound").title()
+    def _decode_status(self, data):
+        """Decode a status response into attributes.
+
+        Unknown or missing fields are tolerated.
+        """
+        status = data.get("status")
+        self._attr_device_status = _decode_label(
+            _STATUS_LABELS, status, replace_underscores=True
+        )
+        if status is None:
+            self._attr_activity = None
+        elif isinstance(status, str):
+            self._attr_activity = API_STATUS_TO_HA.get(status, VacuumActivity.IDLE)
+        else:
+            self._attr_activity = VacuumActivity.IDLE
+        self._attr_brush_type = _decode_label(_BRUSH_LABELS, data.get("brush"))
+        self._attr_sound_status = _decode_label(_SOUND_LABELS, data.get("sound"))
         self._attr_battery_percentage = data.get("battery_percentage")
         self._attr_fan_mode = data.get("fan_mode")
+        self._attr_fan_speed = (
+            REVERSE_API_FAN_SPEEDS.get(self._attr_fan_mode)
+            if isinstance(self._attr_fan_mode, str)
+            else None
+        )
 
         # Handle faults list
-        faults = data.get("faults", [])
+        faults = data.get("faults")
         if faults:
-            self._attr_faults = ", ".join(f.title() for f in faults)
+            self._attr_faults = ", ".join(_decode_label(_FAULT_LABELS, f) for f in faults)
         else:
             self._attr_faults = "None"
-    
+
     async def configure_sound(self, sound_type): 
         await self._send_api_command("configure", {"sound": sound_type})
 
     async def control_vacuum(self, payload): 
         await self._send_api_command("control", payload)
 
+    async def run_sequence(self, steps):
+        """Start a cleaning sequence, replacing any sequence already running."""
+        await self.cancel_sequence()
+        self._sequence_task = self.hass.async_create_background_task(
+            self._async_run_sequence(steps),
+            f"{DOMAIN} sequence {self._device_identifier}",
+        )
+
+    async def cancel_sequence(self):
+        """Cancel the running cleaning sequence, if any."""
+        task = self._sequence_task
+        self._sequence_task = None
+        if task is None or task.done():
+            return
+
+        _LOGGER.debug("Cancel sequence")
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _async_run_sequence(self, steps):
+        """Send each step and wait for its completion condition."""
+        for index, step in enumerate(steps, start=1):
+            _LOGGER.debug("Sequence step %s/%s: %s", index, len(steps), step["payload"])
+
+            try:
+                await self.control_vacuum(step["payload"])
+            except (UpdateFailed, aiohttp.ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.error(
+                    "Sequence stopped at step %s/%s: %s", index, len(steps), repr(err)
+                )
+                return
+
+            if "until_status" not in step and "until_battery_above" not in step:
+                continue
+
+            # Subscribe only once the command was accepted, so the condition is
+            # evaluated on refreshes after the command and never on the state
+            # from before it
+            done = asyncio.Event()
+
+            @callback
+            def _check_step():
+                if self._sequence_step_done(step):
+                    done.set()
+
+            remove_listener = self.async_add_listener(_check_step)
+            timeout = step.get("timeout")
+            try:
+                await asyncio.wait_for(
+                    done.wait(),
+                    timeout.total_seconds()
+                    if timeout is not None
+                    else DEFAULT_SEQUENCE_STEP_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                _LOGGER.warning(
+                    "Sequence stopped, step %s/%s did not complete in time", index, len(steps)
+                )
+                return
+            finally:
+                remove_listener()
+
+        _LOGGER.debug("Sequence finished")
+
+    def _sequence_step_done(self, step):
+        """Return if the completion condition of a sequence step is met."""
+        if "until_status" in step:
+            if self._attr_device_status != API_STATUS_LABELS[step["until_status"]]:
+                return False
+
+        if "until_battery_above" in step:
+            battery = self._attr_battery_percentage
+            if battery is None or battery <= step["until_battery_above"]:
+                return False
+
+        return True
+
     async def _send_api_command(self, command, payload):
         # Determine the HTTP method based on the command
         if command in (None, "version"):
@@ -125,7 +291,7 @@ class HWCleanerCoordinator(DataUpdateCoordinator):
                 async with session.get(url, headers=headers) as response:
                     if response.status == 200:
                         _LOGGER.debug("Command successful: %s", command)
-                        return await response.json() 
+                        return json_loads(await response.read())
                     elif response.status == 401:
                         _LOGGER.debug("Token expired during command, refreshing.")
                         await self._get_token()
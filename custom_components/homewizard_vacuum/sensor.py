@@ -1,7 +1,7 @@
 import aiohttp
 import logging
 
-from .base import HWCleanerBaseEntity
+from .base import HWCleanerBaseEntity, HWCleanerBatteryPublishMixin
 from .const import DOMAIN, CONF_IDENTIFIER
 from .coordinator import HWCleanerCoordinator
 
@@ -89,7 +89,7 @@ class HWVacuumFaultsSensor(HWCleanerBaseEntity, SensorEntity):
         """Return if the sensor is available."""
         return self.coordinator.last_update_success
 
-class HWVacuumBatterySensor(HWCleanerBaseEntity, SensorEntity):
+class HWVacuumBatterySensor(HWCleanerBatteryPublishMixin, HWCleanerBaseEntity, SensorEntity):
     """Sensor entity for the vacuum's battery percentage."""
 
     entity_description = SensorEntityDescription(
@@ -107,4 +107,4 @@ class HWVacuumBatterySensor(HWCleanerBaseEntity, SensorEntity):
 
     @property
     def native_value(self) -> int | None:
-        return self.coordinator._attr_battery_percentage
+        return self._published_battery
@@ -2,13 +2,15 @@ import aiohttp
 import logging
 import voluptuous as vol
 
+from datetime import timedelta
+
 from homeassistant.components.vacuum import (
     StateVacuumEntity,
     VacuumActivity,
     VacuumEntityFeature
 )
-from .base import HWCleanerBaseEntity
-from .const import DOMAIN, CONF_IDENTIFIER
+from .base import HWCleanerBaseEntity, HWCleanerBatteryPublishMixin
+from .const import DOMAIN, CONF_IDENTIFIER, FAN_SPEEDS, API_STATUS_LABELS
 from .coordinator import HWCleanerCoordinator
 
 from homeassistant.config_entries import ConfigEntry
@@ -18,29 +20,28 @@ from homeassistant.helpers import config_validation as cv, entity_platform
 
 _LOGGER = logging.getLogger(__name__)
 
-FAN_SPEEDS = ["Quiet", "Normal", "Strong"]
-API_FAN_SPEEDS = {
-    "Quiet": "stop",
-    "Normal": "normal",
-    "Strong": "strong",
-}
-REVERSE_API_FAN_SPEEDS = {v: k for k, v in API_FAN_SPEEDS.items()}
-
 FAN_SPEED_TO_PROGRAM = {
     "Quiet": "silent",
     "Normal": "auto",
     "Strong": "max",
 }
 
-CLEANER_STATUS_TO_HA = {
-    "Working": VacuumActivity.CLEANING,
-    "Charging": VacuumActivity.DOCKED,
-    "Finished Charging": VacuumActivity.DOCKED,
-    "Standby": VacuumActivity.IDLE,
-    "Stopped": VacuumActivity.IDLE,
-    "Docking": VacuumActivity.RETURNING,
-    "Malfunction": VacuumActivity.ERROR,
-}
+def _api_status(value):
+    """Normalise a status such as "Finished Charging" to its API value."""
+    return cv.string(value).strip().lower().replace(" ", "_")
+
+SEQUENCE_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Required("payload"): dict,
+        vol.Optional("until_status"): vol.All(_api_status, vol.In(API_STATUS_LABELS)),
+        vol.Optional("until_battery_above"): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+        vol.Optional("timeout"): vol.All(
+            cv.positive_time_period, vol.Range(min=timedelta(seconds=1))
+        ),
+    }
+)
 
 SUPPORT_VACUUM = (
     VacuumEntityFeature.BATTERY
@@ -85,8 +86,18 @@ async def async_setup_entry(
         {},
         "async_start_program_random"
     )
+    platform.async_register_entity_service(
+        "run_sequence",
+        {vol.Required("steps"): vol.All(cv.ensure_list, [SEQUENCE_STEP_SCHEMA])},
+        "async_run_sequence"
+    )
+    platform.async_register_entity_service(
+        "cancel_sequence",
+        {},
+        "async_cancel_sequence"
+    )
 
-class HWVacuumCleaner(HWCleanerBaseEntity, StateVacuumEntity):
+class HWVacuumCleaner(HWCleanerBatteryPublishMixin, HWCleanerBaseEntity, StateVacuumEntity):
     """Representation of a Homewizard Vacuum Cleaner."""
 
     _attr_fan_speed_list = FAN_SPEEDS
@@ -94,12 +105,11 @@ class HWVacuumCleaner(HWCleanerBaseEntity, StateVacuumEntity):
 
     @property
     def activity(self) -> VacuumActivity | None:
-        status = self.coordinator._attr_device_status
-        return CLEANER_STATUS_TO_HA.get(status, VacuumActivity.IDLE)
+        return self.coordinator._attr_activity
 
     @property
     def battery_level(self):
-        return self.coordinator._attr_battery_percentage
+        return self._published_battery
 
     @property
     def device_id(self):
@@ -110,7 +120,7 @@ class HWVacuumCleaner(HWCleanerBaseEntity, StateVacuumEntity):
     def icon(self):
         """Return the icon for the current state."""
         icon = None
-        if self.coordinator._attr_device_status in ["malfunction"]:
+        if self.coordinator._attr_activity == VacuumActivity.ERROR:
             icon = "mdi:robot-vacuum-alert"
         else:
             icon = "mdi:robot-vacuum"
@@ -128,7 +138,7 @@ class HWVacuumCleaner(HWCleanerBaseEntity, StateVacuumEntity):
     @property
     def fan_speed(self):
         """Return the status of the vacuum."""
-        return REVERSE_API_FAN_SPEEDS.get(self.coordinator._attr_fan_mode)
+        return self.coordinator._attr_fan_speed
 
     async def async_start(self):
         await self.coordinator.control_vacuum({"activity": "work"})
@@ -151,6 +161,13 @@ class HWVacuumCleaner(HWCleanerBaseEntity, StateVacuumEntity):
     async def async_start_program_random(self):
         await self.coordinator.control_vacuum({"activity": "work", "program": "random"})
 
+    async def async_run_sequence(self, steps):
+        """Run a sequence of commands, each waiting for its completion condition."""
+        await self.coordinator.run_sequence(steps)
+
+    async def async_cancel_sequence(self):
+        await self.coordinator.cancel_sequence()
+
     async def async_set_fan_speed(self, fan_speed, **kwargs):
         """Set the vacuum's fan speed."""
         _LOGGER.debug("Set HA fan speed to: %s", fan_speed)
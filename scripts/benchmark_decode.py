@@ -0,0 +1,78 @@
+"""Compare the per-poll cost of decoding a status response.
+
+The legacy decode is the string manipulation the coordinator did before the
+lookup tables, plus the lookups the vacuum entity did on every state write.
+Run from the repository root in a Home Assistant development environment:
+
+    python scripts/benchmark_decode.py
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.components.vacuum import VacuumActivity
+from homeassistant.util.json import json_loads
+
+from custom_components.homewizard_vacuum.const import REVERSE_API_FAN_SPEEDS
+from custom_components.homewizard_vacuum.coordinator import HWCleanerCoordinator
+
+PAYLOAD = json.dumps(
+    {
+        "status": "finished_charging",
+        "brush": "normal",
+        "sound": "beeps",
+        "battery_percentage": 87,
+        "fan_mode": "normal",
+        "faults": ["side_brush", "wheel"],
+    }
+).encode()
+
+LEGACY_STATUS_TO_HA = {
+    "Working": VacuumActivity.CLEANING,
+    "Charging": VacuumActivity.DOCKED,
+    "Finished Charging": VacuumActivity.DOCKED,
+    "Standby": VacuumActivity.IDLE,
+    "Stopped": VacuumActivity.IDLE,
+    "Docking": VacuumActivity.RETURNING,
+    "Malfunction": VacuumActivity.ERROR,
+}
+
+NUMBER = 200_000
+
+
+def legacy_decode():
+    """Decode the payload the way the coordinator and entities used to."""
+    data = json.loads(PAYLOAD.decode())
+    status = data.get("status").replace("_", " ").title()
+    brush = data.get("brush").title()
+    sound = data.get("sound").title()
+    battery = data.get("battery_percentage")
+    fan_mode = data.get("fan_mode")
+    faults = data.get("faults", [])
+    faults = ", ".join(f.title() for f in faults) if faults else "None"
+    activity = LEGACY_STATUS_TO_HA.get(status, VacuumActivity.IDLE)
+    fan_speed = REVERSE_API_FAN_SPEEDS.get(fan_mode)
+    return status, brush, sound, battery, faults, activity, fan_speed
+
+
+def main():
+    # The decode only touches the _attr_ fields, skip the coordinator setup
+    coordinator = HWCleanerCoordinator.__new__(HWCleanerCoordinator)
+
+    def lookup_decode():
+        coordinator._decode_status(json_loads(PAYLOAD))
+        return coordinator._attr_activity, coordinator._attr_fan_speed
+
+    # Fill the label caches before timing
+    lookup_decode()
+
+    for name, func in (("legacy", legacy_decode), ("lookup", lookup_decode)):
+        best = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:>6}: {best / NUMBER * 1e6:.2f} us per poll")
+
+
+if __name__ == "__main__":
+    main()